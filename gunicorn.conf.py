@@ -0,0 +1,16 @@
+"""
+gunicorn configuration
+
+The gevent worker monkey-patches the Python standard library, but
+psycopg2 is a C extension that blocks inside libpq regardless. Install
+psycogreen's wait callback in each worker so database waits also yield
+the greenlet instead of stalling the whole event loop.
+"""
+
+
+def post_fork(server, worker):  # pylint: disable=unused-argument
+    """Makes psycopg2 cooperative right after each worker is forked"""
+    from psycogreen.gevent import patch_psycopg  # pylint: disable=import-outside-toplevel
+
+    patch_psycopg()
+    worker.log.info("Patched psycopg2 for gevent (psycogreen)")
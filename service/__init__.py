@@ -4,14 +4,34 @@ Package for the application models and service routes
 This module creates and configures the Flask app and sets up the logging
 and SQL database
 """
+# The gunicorn gevent worker monkey-patches the standard library before
+# loading the app, and gunicorn.conf.py patches psycopg2 via psycogreen
+# (the stdlib patching alone never reaches libpq's C-level blocking I/O),
+# so no import-time patching is needed (or wanted) here
 import sys
 from flask import Flask
+from flask_orjson import OrjsonProvider
+from werkzeug.routing import IntegerConverter
 from service import config
 from service.common import log_handlers
 
 # Create Flask application
 app = Flask(__name__)
 app.config.from_object(config)
+# Use orjson for JSON encoding/decoding (much faster than the stdlib json)
+app.json = OrjsonProvider(app)
+
+
+class PosIntConverter(IntegerConverter):
+    """Matches positive integers with a bare regex (no min/max checks)"""
+
+    regex = r"[1-9]\d*"
+
+
+# Trim routing work: a specialized id converter and no slash fix-ups
+app.url_map.converters["posint"] = PosIntConverter
+app.url_map.strict_slashes = False
+app.url_map.merge_slashes = False
 
 # Dependencies require we import the routes AFTER the Flask app is created
 # pylint: disable=wrong-import-position, wrong-import-order, cyclic-import
@@ -12,5 +12,18 @@ DATABASE_URI = os.getenv(
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# Tune the connection pool for concurrent (gevent) workers and enable
+# psycopg2 batched statement execution. These options are PostgreSQL
+# specific, so skip them for other database backends.
+SQLALCHEMY_ENGINE_OPTIONS = {}
+if DATABASE_URI.startswith("postgresql"):
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 20,
+        "max_overflow": 40,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "executemany_mode": "values_plus_batch",
+    }
+
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "s3cr3t-key-shhhh")
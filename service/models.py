@@ -7,6 +7,7 @@ import logging
 from datetime import date
 from abc import abstractmethod
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import selectinload
 
 logger = logging.getLogger("flask.app")
 
@@ -73,8 +74,23 @@ class PersistentBase:
         cls.app = app
         # This is where we initialize SQLAlchemy from the Flask app
         db.init_app(app)
-        app.app_context().push()
-        db.create_all()  # make our sqlalchemy tables
+        # Use a temporary context so none is left pushed at startup;
+        # a lingering one would be shared by all concurrent requests
+        with app.app_context():
+            db.create_all()  # make our sqlalchemy tables
+
+    @classmethod
+    def bulk_create(cls, objects):
+        """Saves a batch of objects in a single bulk INSERT
+
+        return_defaults keeps the generated primary keys populated on the
+        passed-in objects, like create() does for a single one.
+        """
+        logger.info("Bulk creating %d objects", len(objects))
+        for obj in objects:
+            obj.id = None  # id must be none to generate next primary key
+        db.session.bulk_save_objects(objects, return_defaults=True)
+        db.session.commit()
 
     @classmethod
     def all(cls):
@@ -84,9 +100,13 @@ class PersistentBase:
 
     @classmethod
     def find(cls, by_id):
-        """Finds a Wishlist by it's ID"""
+        """Finds a Wishlist by it's ID
+
+        session.get() checks the identity map first and skips Query
+        compilation, unlike the legacy Query.get().
+        """
         logger.info("Processing lookup for id %s ...", by_id)
-        return cls.query.get(by_id)
+        return db.session.get(cls, by_id)
 
 
 ######################################################################
@@ -109,13 +129,66 @@ class Wishlist(db.Model, PersistentBase):
     def __repr__(self):
         return f"<wishlist_id=[{self.id}]>"
 
+    @classmethod
+    def exists(cls, by_id):
+        """Returns True if a Wishlist with the given id exists
+
+        Selects just the primary key instead of loading the full row.
+        """
+        logger.info("Processing existence check for id %s ...", by_id)
+        return db.session.query(cls.id).filter_by(id=by_id).scalar() is not None
+
+    @classmethod
+    def collection_etag(cls):
+        """Returns a cheap fingerprint of the wishlists collection
+
+        Built from count and max id in a single aggregate SELECT; the
+        collection only changes through creates and deletes, both of
+        which move at least one of the two.
+        """
+        count, max_id = db.session.execute(
+            db.select(db.func.count(cls.id), db.func.max(cls.id))
+        ).one()
+        return f"{count}-{max_id}"
+
+    @classmethod
+    def find_with_items(cls, by_id):
+        """Finds a Wishlist by it's ID with its items eager-loaded
+
+        Uses a selectinload so accessing .items afterwards never issues
+        a lazy-load SELECT per parent.
+        """
+        logger.info("Processing lookup with items for id %s ...", by_id)
+        return db.session.get(cls, by_id, options=[selectinload(cls.items)])
+
+    @classmethod
+    def all_serialized(cls):
+        """Yields all of the Wishlists as plain dictionaries
+
+        Issues a single Core SELECT and feeds the row mappings straight
+        to the JSON encoder one at a time, skipping ORM instrumentation
+        and per-object serialize() calls on the read path.
+        """
+        logger.info("Processing all Wishlists (vectorized)")
+        rows = db.session.execute(
+            db.select(cls.id, cls.customer_id, cls.wishlist_name, cls.created_date)
+        ).mappings()
+        return (dict(row) for row in rows)
+
     def serialize(self):
         """Converts an Wishlist into a dictionary"""
+        # Read from __dict__ to skip the instrumented descriptor protocol;
+        # one attribute access first re-loads the state if a commit expired it
+        attrs = self.__dict__
+        if "id" not in attrs:
+            _ = self.id
+            attrs = self.__dict__
         wishlist = {
-            "id": self.id,
-            "customer_id": self.customer_id,
-            "wishlist_name": self.wishlist_name,
-            "created_date": self.created_date.isoformat(),
+            "id": attrs["id"],
+            "customer_id": attrs["customer_id"],
+            "wishlist_name": attrs["wishlist_name"],
+            # left as a date; orjson emits ISO-8601 natively at encode time
+            "created_date": attrs["created_date"],
         }
         return wishlist
 
@@ -129,7 +202,10 @@ class Wishlist(db.Model, PersistentBase):
         try:
             self.customer_id = data["customer_id"]
             self.wishlist_name = data["wishlist_name"]
-            self.created_date = date.fromisoformat(data["created_date"])
+            created_date = data["created_date"]
+            if not isinstance(created_date, date):
+                created_date = date.fromisoformat(created_date)
+            self.created_date = created_date
         except KeyError as error:
             raise DataValidationError(
                 "Invalid Wishlist: missing " + error.args[0]
@@ -159,7 +235,8 @@ class WishlistItem(db.Model, PersistentBase):
     )
     product_id = db.Column(db.Integer)
     product_name = db.Column(db.String(255))
-    product_price = db.Column(db.Numeric)
+    # Explicit scale keeps price round-trips identical across dialects
+    product_price = db.Column(db.Numeric(10, 2))
     quantity = db.Column(db.Integer)
     created_date = db.Column(db.Date(), nullable=False, default=date.today())
 
@@ -176,15 +253,57 @@ class WishlistItem(db.Model, PersistentBase):
             f")"
         )
 
+    @classmethod
+    def delete_by_id(cls, item_id, wishlist_id):
+        """Deletes an Item with a single DELETE statement
+
+        Returns the number of rows deleted without hydrating any objects,
+        so callers can distinguish a miss from a successful delete.
+        """
+        logger.info("Deleting item %s for wishlist %s", item_id, wishlist_id)
+        deleted = cls.query.filter_by(id=item_id, wishlist_id=wishlist_id).delete(
+            synchronize_session=False
+        )
+        db.session.commit()
+        return deleted
+
+    @classmethod
+    def find_by_wishlist_id_serialized(cls, wishlist_id):
+        """Yields all of the Items for a Wishlist as plain dictionaries
+
+        Same vectorized Core SELECT pattern as Wishlist.all_serialized().
+        """
+        logger.info(
+            "Processing serialized item lookup for wishlist_id %s ...", wishlist_id
+        )
+        rows = db.session.execute(
+            db.select(
+                cls.id,
+                cls.wishlist_id,
+                cls.product_id,
+                cls.product_name,
+                cls.product_price,
+                cls.quantity,
+                cls.created_date,
+            ).where(cls.wishlist_id == wishlist_id)
+        ).mappings()
+        return (dict(row) for row in rows)
+
     def serialize(self):
+        # Same __dict__ fast path as Wishlist.serialize()
+        attrs = self.__dict__
+        if "id" not in attrs:
+            _ = self.id
+            attrs = self.__dict__
         return {
-            "id": self.id,
-            "wishlist_id": self.wishlist_id,
-            "product_id": self.product_id,
-            "product_name": self.product_name,
-            "product_price": self.product_price,
-            "quantity": self.quantity,
-            "created_date": self.created_date.isoformat(),
+            "id": attrs["id"],
+            "wishlist_id": attrs["wishlist_id"],
+            "product_id": attrs["product_id"],
+            "product_name": attrs["product_name"],
+            "product_price": attrs["product_price"],
+            "quantity": attrs["quantity"],
+            # left as a date; orjson emits ISO-8601 natively at encode time
+            "created_date": attrs["created_date"],
         }
 
     def deserialize(self, data: dict):
@@ -195,7 +314,10 @@ class WishlistItem(db.Model, PersistentBase):
             self.product_name = data["product_name"]
             self.product_price = data["product_price"]
             self.quantity = data["quantity"]
-            self.created_date = date.fromisoformat(data["created_date"])
+            created_date = data["created_date"]
+            if not isinstance(created_date, date):
+                created_date = date.fromisoformat(created_date)
+            self.created_date = created_date
         except KeyError as error:
             raise DataValidationError(
                 "Invalid Wishlist Item: missing " + error.args[0]
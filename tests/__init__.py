@@ -0,0 +1,33 @@
+"""
+Package: tests
+
+Defaults the test run to in-memory SQLite, which is dramatically faster
+than a networked database for unit tests; export DATABASE_URI to run the
+suite against PostgreSQL instead. This runs before the service package
+is imported, so the engine and its connections pick everything up.
+"""
+import os
+
+os.environ.setdefault("DATABASE_URI", "sqlite:///:memory:")
+
+# The imports must come after the environment default above
+# pylint: disable=wrong-import-position
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+
+if os.environ["DATABASE_URI"].startswith("sqlite"):
+    # pysqlite ships with foreign keys off and a legacy transaction mode
+    # that breaks SAVEPOINTs; take over transaction control ourselves
+
+    @event.listens_for(Engine, "connect")
+    def _sqlite_connect(dbapi_connection, _connection_record):
+        """Enables FK enforcement and disables implicit transactions"""
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @event.listens_for(Engine, "begin")
+    def _sqlite_begin(connection):
+        """Emits BEGIN explicitly since implicit transactions are off"""
+        connection.exec_driver_sql("BEGIN")
@@ -0,0 +1,109 @@
+"""
+Base TestCase that runs every test inside a rolled-back transaction
+"""
+import os
+import logging
+import unittest
+from sqlalchemy import text
+from flask_sqlalchemy.session import Session
+from service import app
+from service.models import Wishlist, db
+
+# In-memory SQLite is the default for unit tests (see tests/__init__.py);
+# point DATABASE_URI at PostgreSQL for integration runs
+DATABASE_URI = os.getenv("DATABASE_URI", "sqlite:///:memory:")
+
+# Module-level flag, not a constant; it flips once the schema exists
+_db_initialized = False  # pylint: disable=invalid-name
+
+
+def init_test_db():
+    """Configures the app and creates the schema once per test run
+
+    Every test class shares the same engine and tables; repeated calls
+    are no-ops so it is safe from any setUpClass.
+    """
+    # pylint: disable-next=global-statement, invalid-name
+    global _db_initialized
+    if _db_initialized:
+        return
+    app.config["TESTING"] = True
+    app.config["DEBUG"] = False
+    app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
+    app.logger.setLevel(logging.CRITICAL)
+    Wishlist.init_db(app)
+    # The tests use db.session outside of requests, so keep one app
+    # context pushed for the duration of the (sequential) test run
+    app.app_context().push()
+    _db_initialized = True
+
+
+def clean_tables():
+    """Empties the wishlist tables in constant time
+
+    On PostgreSQL a single TRUNCATE ... RESTART IDENTITY CASCADE is O(1)
+    metadata work and resets the id sequences, unlike a row-by-row
+    DELETE. SQLite has no TRUNCATE, so fall back to DELETE there (its
+    rowids reset on their own once the table is empty).
+    """
+    if db.engine.dialect.name == "postgresql":
+        db.session.execute(
+            text("TRUNCATE wishlist, wishlist_items RESTART IDENTITY CASCADE")
+        )
+    else:
+        db.session.query(Wishlist).delete()
+    db.session.commit()
+
+
+class BoundSession(Session):  # pylint: disable=too-few-public-methods
+    """Session that honors the bind it was created with
+
+    Flask-SQLAlchemy's Session.get_bind always resolves to an engine,
+    which would bypass the per-test connection below, so prefer the
+    session-level bind when one is set.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if self.bind is not None:
+            return self.bind
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+class TransactionalTestCase(unittest.TestCase):
+    """Wraps each test in a SAVEPOINT that is rolled back afterwards
+
+    setUp binds the session to a dedicated connection with an open outer
+    transaction; tearDown rolls the whole thing back. No per-test cleanup
+    DELETE+COMMIT round trips are needed.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """This runs once before the entire test suite"""
+        init_test_db()
+        # Start from clean tables once per class instead of once per test
+        clean_tables()
+
+    def setUp(self):
+        """This runs before each test"""
+        self.connection = db.engine.connect()
+        self.transaction = self.connection.begin()
+        # Commits inside the test only release savepoints on this
+        # connection; the outer transaction stays open until tearDown
+        self.default_session = db.session
+        # Flask-SQLAlchemy offers no public hook for a bound session
+        # pylint: disable-next=protected-access
+        db.session = db._make_scoped_session(
+            {
+                "class_": BoundSession,
+                "bind": self.connection,
+                "join_transaction_mode": "create_savepoint",
+            }
+        )
+
+    def tearDown(self):
+        """This runs after each test"""
+        db.session.remove()
+        db.session = self.default_session
+        self.transaction.rollback()
+        self.connection.close()
@@ -5,6 +5,7 @@ import os
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
+from service import app
 from service.common.cli_commands import db_create
 
 
@@ -19,5 +20,7 @@ class TestFlaskCLI(TestCase):
         """It should call the db-create command"""
         db_mock.return_value = MagicMock()
         with patch.dict(os.environ, {"FLASK_APP": "service:app"}, clear=True):
-            result = self.runner.invoke(db_create)
+            # No context is left pushed at import anymore, so provide one
+            with app.app_context():
+                result = self.runner.invoke(db_create)
             self.assertEqual(result.exit_code, 0)